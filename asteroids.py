@@ -1,7 +1,8 @@
-import os
-os.environ['PYGBAG_DEBUG'] = '1'
-os.environ['PYGBAG_ARCHIVE'] = 'https://github.com/pygame-web/builds/releases/download/0.9/'
+import time
+_IMPORT_START = time.perf_counter()  # Début de l'import (pour --startup-report)
 
+import os
+import sys
 import pygame
 import math
 import random
@@ -56,6 +57,50 @@ POWERUP_DURATION = {
     'laser': 3000,          # ms
     # bomb: effet immédiat
 }
+FONT_SIZES = (22, 24, 32, 34, 36, 74)  # Tailles de police utilisées par le jeu
+
+# --- Démarrage ---
+# Aucun accès à l'écran à l'import : la logique du jeu reste importable
+# à moindre coût (tests, outils). Tout se fait dans main().
+_fonts = {}
+startup_times = {}
+
+def configure_pygbag():
+    os.environ['PYGBAG_DEBUG'] = '1'
+    os.environ['PYGBAG_ARCHIVE'] = 'https://github.com/pygame-web/builds/releases/download/0.9/'
+
+def init_pygame(full_init=False):
+    if full_init:
+        pygame.init()  # Tous les sous-systèmes (mixer, joystick...)
+    else:
+        # Uniquement ce qui est utilisé : l'affichage (qui initialise aussi
+        # les événements) et les polices. Le timer est initialisé par Clock.
+        pygame.display.init()
+        pygame.font.init()
+
+def quit_pygame():
+    # Les polices en cache ne survivent pas à pygame.quit()
+    _fonts.clear()
+    pygame.quit()
+
+def get_font(size):
+    # Cache des polices : évite de recharger la police à chaque frame
+    font = _fonts.get(size)
+    if font is None:
+        font = _fonts[size] = pygame.font.Font(None, size)
+    return font
+
+def warm_up_assets():
+    # Préparation étagée : polices d'abord, puis le fond étoilé de la première partie
+    for size in FONT_SIZES:
+        get_font(size)
+    return generate_stars()
+
+def print_startup_report():
+    print("Startup report:")
+    for stage in ('import', 'init', 'assets', 'first_frame'):
+        print(f"  {stage:<12} {startup_times.get(stage, 0.0) * 1000:8.1f} ms")
+    print(f"  {'total':<12} {sum(startup_times.values()) * 1000:8.1f} ms")
 
 class Player:
     def __init__(self):
@@ -93,7 +138,7 @@ class Player:
             
             # Affichage du chrono
             if time_left > 0:
-                font = pygame.font.Font(None, 24)
+                font = get_font(24)
                 text = font.render(f"Bouclier: {time_left//1000}s", True, (0, 150, 255))
                 text_rect = text.get_rect(center=(self.x, self.y - 50))
                 screen.blit(text, text_rect)
@@ -194,7 +239,7 @@ class PowerUp:
         self.id = next(PowerUp._id_iter)
     def draw(self, screen):
         pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius)
-        font = pygame.font.Font(None, 22)
+        font = get_font(22)
         initials = {
             'life': 'V',          # Vie
             'triple_shot': 'T',  # Tir triple
@@ -223,7 +268,7 @@ class FloatingText:
         self.opacity = max(0, 255 - int(255 * (elapsed / self.lifetime)))
         return elapsed < self.lifetime
     def draw(self, screen):
-        font = pygame.font.Font(None, 34)
+        font = get_font(34)
         surf = font.render(self.text, True, self.color)
         surf.set_alpha(self.opacity)
         rect = surf.get_rect(center=(self.x, self.y))
@@ -251,18 +296,18 @@ def check_player_collision(player, asteroids):
     return collision
 
 def show_game_over(screen):
-    font = pygame.font.Font(None, 74)
+    font = get_font(74)
     text = font.render('GAME OVER', True, (255, 0, 0))
     text_rect = text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2 - 50))
     
-    font_small = pygame.font.Font(None, 36)
+    font_small = get_font(36)
     restart_text = font_small.render('Appuyez sur R pour rejouer', True, (255,255,255))
     restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/2 + 50))
     
     while True:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                pygame.quit()
+                quit_pygame()
                 return False
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_r:
@@ -321,11 +366,19 @@ def random_star_color():
         for c in base
     )
 
-def main():
-    pygame.init()
+def main(full_init=False, startup_report=False):
+    startup_times['import'] = _IMPORT_END - _IMPORT_START
+    stage_start = time.perf_counter()
+    init_pygame(full_init)
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Asteroids")
     clock = pygame.time.Clock()
+    startup_times['init'] = time.perf_counter() - stage_start
+    stage_start = time.perf_counter()
+    stars = warm_up_assets()
+    startup_times['assets'] = time.perf_counter() - stage_start
+    stage_start = time.perf_counter()
+    first_frame = True
     running = True
     bomb_active = False
     bomb_radius = 0
@@ -343,7 +396,8 @@ def main():
         level = 1
         asteroids = [Asteroid() for _ in range(3)]  # Lvl 1 = 3 astéroïdes
         particles = deque(maxlen=300)
-        stars = generate_stars()  # Génération du fond étoilé
+        if stars is None:
+            stars = generate_stars()  # Génération du fond étoilé
         last_spawn_time = pygame.time.get_ticks()
         powerups = []
         floating_texts = []
@@ -585,7 +639,7 @@ def main():
                 ft.draw(screen)
 
             # Affichage des vies, du score et du niveau
-            font = pygame.font.Font(None, 36)
+            font = get_font(36)
             text = font.render(f"Vies: {player.lives}", True, (255, 255, 255))
             screen.blit(text, (10, 10))
             text = font.render(f"Score: {player.score}", True, (255, 255, 0))
@@ -599,7 +653,7 @@ def main():
                 left = max(0, (end-now)//1000)
                 txt = {'triple_shot': 'Tir triple', 'invincible': 'Bouclier', 'slowmo': 'Ralenti', 'laser': 'Laser'}[ptype]
                 color = POWERUP_COLORS[ptype]
-                font = pygame.font.Font(None, 32)
+                font = get_font(32)
                 timer_str = f'{txt}: {left}s'
                 text = font.render(timer_str, True, color)
                 bg_rect = text.get_rect(topleft=(10, bonus_y))
@@ -660,15 +714,25 @@ def main():
                 screen.blit(bomb_surf, (0,0))
 
             pygame.display.flip()
+            if first_frame:
+                first_frame = False
+                startup_times['first_frame'] = time.perf_counter() - stage_start
+                if startup_report:
+                    print_startup_report()
             clock.tick(60)
 
+        stars = None  # Nouveau fond étoilé à la prochaine partie
         # --- Affiche l'écran de Game Over et attend une action ---
         if show_game_over(screen):
             continue
         else:
             running = False
 
-    pygame.quit()
+    quit_pygame()
+
+_IMPORT_END = time.perf_counter()  # Fin du corps du module
 
 if __name__ == "__main__":
-    main()
+    configure_pygbag()
+    main(full_init='--full-init' in sys.argv[1:],
+         startup_report='--startup-report' in sys.argv[1:])